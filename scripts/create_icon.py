@@ -4,12 +4,71 @@ Create macOS Application Icon for Requirements to Test
 Generates a high-resolution icon with a checklist design
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 import os
 
-
-def create_icon():
+if TYPE_CHECKING:
+    import PIL.Image
+    import PIL.ImageDraw
+
+# PIL and the optional resizer are imported inside the functions that use
+# them, so importing this module stays cheap for tooling that only inspects it
+
+
+@lru_cache(maxsize=None)
+def _lanczos_resizer() -> Optional[tuple]:
+    """Return the shared cykooz resizer and its Lanczos options, or None"""
+    try:
+        # Optional SIMD resizer (pip install cykooz-resizer); Pillow is used without it
+        from cykooz_resizer import FilterType, ResizeAlg, ResizeOptions, Resizer
+    except ImportError:
+        return None
+    # One shared resizer picks the best CPU extensions (AVX2, SSE4.1, Neon)
+    # available and keeps its filter coefficients between resizes
+    return Resizer(), ResizeOptions(resize_alg=ResizeAlg.convolution(FilterType.lanczos3))
+
+
+def resize_icon(image: 'PIL.Image.Image', size: int, box: bool = False) -> 'PIL.Image.Image':
+    """Resize an RGBA icon to size x size with a Lanczos filter, or a box filter if box"""
+    from PIL import Image
+
+    if box:
+        return image.resize((size, size), Image.Resampling.BOX)
+    resizer = _lanczos_resizer()
+    if resizer is None:
+        return image.resize((size, size), Image.Resampling.LANCZOS)
+    resized = Image.new('RGBA', (size, size))
+    resizer[0].resize_pil(image, resized, resizer[1])
+    return resized
+
+
+def create_icon_pyramid(base_icon: 'PIL.Image.Image', sizes: Iterable[int]) -> Dict[int, 'PIL.Image.Image']:
+    """Resize the base icon to every size, halving from already resized icons"""
+    # Each size is resized from the smallest icon at least twice as large, so
+    # most steps convolve a source four times smaller than the one before
+    pyramid = {base_icon.width: base_icon}
+    for size in sorted(set(sizes), reverse=True):
+        if size not in pyramid:
+            source = min((s for s in pyramid if s >= 2 * size), default=base_icon.width)
+            # At 32px and below an exact 2:1 box average looks the same as
+            # Lanczos and skips the convolution taps
+            pyramid[size] = resize_icon(pyramid[source], size,
+                                        box=source == 2 * size and size <= 32)
+    return pyramid
+
+
+def save_png(image_and_filename: Tuple['PIL.Image.Image', str]) -> str:
+    """Save an (image, filename) pair as PNG and return the filename"""
+    image, filename = image_and_filename
+    image.save(filename, "PNG")
+    return filename
+
+
+def create_icon() -> 'PIL.Image.Image':
     """Create a modern icon for Requirements to Test"""
+    from PIL import Image, ImageDraw, ImageFilter
 
     # Create high-resolution image for icon (1024x1024 for macOS)
     size = 1024
@@ -44,16 +103,24 @@ def create_icon():
     sheet_x1 = sheet_x0 + sheet_w
     sheet_y1 = sheet_y0 + sheet_h
 
-    # Sheet drop shadow
+    # Sheet drop shadow: a blurred mask the size of the sheet, composited onto
+    # the card in one paste instead of overwriting it with translucent pixels
     shadow_offset = 14
-    draw.rounded_rectangle(
-        [sheet_x0 + shadow_offset, sheet_y0 + shadow_offset, sheet_x1 + shadow_offset, sheet_y1 + shadow_offset],
+    shadow_pad = 30
+    shadow = Image.new('L', (sheet_w + 2 * shadow_pad, sheet_h + 2 * shadow_pad), 0)
+    ImageDraw.Draw(shadow).rounded_rectangle(
+        [shadow_pad, shadow_pad, sheet_w + shadow_pad, sheet_h + shadow_pad],
         40,
-        fill=(0, 0, 0, 60),
+        fill=90,
     )
+    shadow = shadow.filter(ImageFilter.GaussianBlur(12))
+    img.paste((0, 0, 0, 255),
+              (sheet_x0 - shadow_pad + shadow_offset, sheet_y0 - shadow_pad + shadow_offset),
+              shadow)
 
     # Paper sheet
-    draw.rounded_rectangle([sheet_x0, sheet_y0, sheet_x1, sheet_y1], 36, fill=(255, 255, 255, 255))
+    paper_color = (255, 255, 255, 255)
+    draw.rounded_rectangle([sheet_x0, sheet_y0, sheet_x1, sheet_y1], 36, fill=paper_color)
 
     # Top header strip
     header_h = 70
@@ -69,17 +136,17 @@ def create_icon():
     text_height = 20
     text_color = (228, 234, 242, 255)
 
-    for i in range(rows):
-        y = start_y + i * row_gap
+    def draw_row(row_draw: 'PIL.ImageDraw.ImageDraw', x0: int, x1: int, y: int, checked: bool) -> None:
+        """Draw one checklist row across the sheet from x0 to x1, centred on y"""
         # Checkbox
-        cb_x0 = sheet_x0 + left_pad
+        cb_x0 = x0 + left_pad
         cb_y0 = y - checkbox_size // 2
         cb_x1 = cb_x0 + checkbox_size
         cb_y1 = cb_y0 + checkbox_size
-        draw.rounded_rectangle([cb_x0, cb_y0, cb_x1, cb_y1], 10, outline=(140, 150, 165, 255), width=6, fill=(250, 252, 255, 255))
+        row_draw.rounded_rectangle([cb_x0, cb_y0, cb_x1, cb_y1], 10, outline=(140, 150, 165, 255), width=6, fill=(250, 252, 255, 255))
 
         # Check some rows
-        if i in (0, 1, 3, 5):
+        if checked:
             # Draw a green checkmark
             check_color = (34, 197, 94, 255)  # green
             # Coordinates for a stylized check
@@ -89,22 +156,34 @@ def create_icon():
             cy1 = cb_y0 + checkbox_size - 12
             cx2 = cb_x1 - 10
             cy2 = cb_y0 + 12
-            draw.line([(cx0, cy0), (cx1, cy1)], fill=check_color, width=10)
-            draw.line([(cx1, cy1), (cx2, cy2)], fill=check_color, width=10)
+            row_draw.line([(cx0, cy0), (cx1, cy1)], fill=check_color, width=10)
+            row_draw.line([(cx1, cy1), (cx2, cy2)], fill=check_color, width=10)
 
         # Text lines to the right of checkbox
         tx0 = cb_x1 + text_gap
-        tx1 = sheet_x1 - left_pad
+        tx1 = x1 - left_pad
         # Primary long line
-        draw.rounded_rectangle([tx0, y - text_height // 2, tx1, y - text_height // 2 + text_height], 10, fill=text_color)
+        row_draw.rounded_rectangle([tx0, y - text_height // 2, tx1, y - text_height // 2 + text_height], 10, fill=text_color)
         # Secondary shorter line below for rhythm
         sub_y = y + 22
-        draw.rounded_rectangle([tx0, sub_y - 8, tx0 + (tx1 - tx0) * 0.55, sub_y + 8], 8, fill=(236, 240, 247, 255))
+        row_draw.rounded_rectangle([tx0, sub_y - 8, tx0 + (tx1 - tx0) * 0.55, sub_y + 8], 8, fill=(236, 240, 247, 255))
+
+    # Rows only differ by their offset and checkmark, so draw a checked and an
+    # unchecked row once on plain paper and paste copies down the sheet
+    row_templates = {}
+    for checked in (False, True):
+        template = Image.new('RGBA', (sheet_w, row_gap), paper_color)
+        draw_row(ImageDraw.Draw(template), 0, sheet_w, row_gap // 2, checked)
+        row_templates[checked] = template
+
+    for i in range(rows):
+        y = start_y + i * row_gap
+        img.paste(row_templates[i in (0, 1, 3, 5)], (sheet_x0, y - row_gap // 2))
 
     return img
 
 
-def create_icon_set():
+def create_icon_set() -> None:
     """Create a complete icon set for macOS"""
 
     base_icon = create_icon()
@@ -116,30 +195,32 @@ def create_icon_set():
     if not os.path.exists("icons"):
         os.makedirs("icons")
 
-    for size in sizes:
-        # Resize image with high quality
-        resized = base_icon.resize((size, size), Image.Resampling.LANCZOS)
+    # Icon sizes for Windows ICO files
+    ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128),
+                 (256, 256)]
 
-        # Save as PNG
-        filename = f"icons/requirements_to_test_{size}x{size}.png"
-        resized.save(filename, "PNG")
-        print(f"Created {filename}")
+    # Resize once for both the PNG and the ICO sizes
+    pyramid = create_icon_pyramid(base_icon, sizes + [size for size, _ in ico_sizes])
 
-    # Save the main icon
-    base_icon.save("icons/requirements_to_test.png", "PNG")
-    print("Created icons/requirements_to_test.png")
+    # PNG files to write, with the main icon alongside the sized ones
+    png_files = [(pyramid[size], f"icons/requirements_to_test_{size}x{size}.png")
+                 for size in sizes]
+    # base_icon is already the 1024 entry; Image.save stores encoder state on
+    # the image, so the second concurrent save gets its own copy
+    png_files.append((base_icon.copy(), "icons/requirements_to_test.png"))
 
-    # Create ICO file for cross-platform compatibility
-    ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128),
-                 (256, 256)]
-    ico_images = []
+    # Pillow releases the GIL while compressing, so the PNGs save in parallel
+    with ThreadPoolExecutor(max_workers=min(len(png_files), os.cpu_count() or 1)) as pool:
+        for filename in pool.map(save_png, png_files):
+            print(f"Created {filename}")
 
-    for size in ico_sizes:
-        resized = base_icon.resize(size, Image.Resampling.LANCZOS)
-        ico_images.append(resized)
+    # Create ICO file for cross-platform compatibility
+    ico_images = [pyramid[size] for size, _ in ico_sizes]
 
-    # Save as ICO
-    ico_images[0].save("icons/requirements_to_test.ico", format="ICO", sizes=ico_sizes)
+    # Save as ICO from the largest image, handing Pillow the other sizes ready
+    # made; saved from 16x16 it would drop every larger size
+    ico_images[-1].save("icons/requirements_to_test.ico", format="ICO", sizes=ico_sizes,
+                        append_images=ico_images[:-1])
     print("Created icons/requirements_to_test.ico")
 
     print("\nIcon set created successfully!")
@@ -4,29 +4,36 @@ Setup script for requirements-to-test.
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # Read the contents of README file
 this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text(encoding='utf-8')
 
+_VERSION_RE = re.compile(r"__version__\s*=\s*['\"]([^'\"]*)['\"]")
+
 
 # Read requirements
-def read_requirements(filename):
-    """Read requirements from file."""
+@lru_cache(maxsize=None)
+def _requirement_lines(filename):
+    """Read and filter requirement lines from file once per process."""
 
     requirements_file = this_directory / filename
     if requirements_file.exists():
-        with open(requirements_file, 'r', encoding='utf-8') as f:
-            requirements = []
-            for line in f:
-                line = line.strip()
-                # Skip empty lines, comments, and -r references
-                if line and not line.startswith('#') and not line.startswith('-r'):
-                    requirements.append(line)
-            return requirements
-    return []
+        lines = (line.strip() for line in requirements_file.read_text(encoding='utf-8').splitlines())
+        # Skip empty lines, comments, and -r references
+        return tuple(line for line in lines if line and not line.startswith(('#', '-r')))
+    return ()
+
+
+def read_requirements(filename):
+    """Read requirements from file."""
+
+    # Hand out a fresh list so callers cannot alter the cached lines
+    return list(_requirement_lines(filename))
 
 
 # Read version from the package __init__.py in src layout
@@ -34,9 +41,11 @@ def get_version():
     """Extract version from src/requirements_to_test/__init__.py."""
     version_file = this_directory / "src" / "requirements_to_test" / "__init__.py"
     if version_file.exists():
-        import re
-        content = version_file.read_text(encoding='utf-8')
-        version_match = re.search(r"__version__\s*=\s*['\"]([^'\"]*)['\"]", content)
+        # __version__ is declared at the top of the module, so its first page
+        # is enough
+        with open(version_file, 'rb') as f:
+            head = f.read(4096).decode('utf-8', 'ignore')
+        version_match = _VERSION_RE.search(head)
         if version_match:
             return version_match.group(1)
     return "1.0.0"
@@ -54,7 +63,8 @@ setup(
         "Bug Reports": "https://github.com/yourusername/requirements-to-test/issues",
         "Source": "https://github.com/yourusername/requirements-to-test",
     },
-    packages=find_packages(where="src"),
+    # Fixed src layout; list any new subpackages here
+    packages=["requirements_to_test"],
     package_dir={"": "src"},
     py_modules=[],
     include_package_data=True,
@@ -80,6 +90,7 @@ setup(
     extras_require={
         "dev": read_requirements("requirements-dev.txt"),
         "gui": ["wxPython>=4.2.0"],
+        "icons": ["Pillow>=9.1.0", "cykooz-resizer"],
     },
     entry_points={
         "console_scripts": [
@@ -12,11 +12,12 @@ __description__ = "Convert natural language requirements into testable checklist
 
 # Export only lightweight, non-GUI components by default to avoid wx dependency on import
 from .parser import RequirementsParser
-from .generator import TestCodeGenerator
+from .generator import TestCodeGenerator, CategoryTestCodeGenerator
 from .runner import TestRunner
 
 __all__ = [
     'RequirementsParser',
     'TestCodeGenerator',
+    'CategoryTestCodeGenerator',
     'TestRunner'
 ] 
\ No newline at end of file
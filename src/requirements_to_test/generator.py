@@ -3,76 +3,294 @@ Test code generator module for creating pytest/unittest code from requirements.
 """
 
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
+
+_PUNCT = re.compile(r'[^\w\s]')
+_WS = re.compile(r'\s+')
+# ASCII characters _PUNCT removes, for deleting them with bytes.translate
+_PUNCT_BYTES = bytes(c for c in range(128) if _PUNCT.match(chr(c)))
+
+# Body lines shared by every generated test stub
+_METHOD_STATIC_TAIL = (
+    "        ",
+    "        # Example test structure:",
+    "        # 1. Setup test data",
+    "        # 2. Execute the functionality",
+    "        # 3. Assert expected results",
+    "        ",
+    "        assert True  # Replace with actual test implementation"
+)
 
 
 class TestCodeGenerator:
     """Generate pytest/unittest code from requirements"""
     
-    def generate_pytest_code(self, requirements: List[Dict[str, str]], class_name: str = "TestRequirements") -> str:
-        """Generate pytest code for the requirements"""
-        code_lines = [
-            "import pytest",
-            "import unittest",
-            "from unittest.mock import Mock, patch",
+    # Not a test class, despite the name
+    __test__ = False
+    
+    # Module imports placed above the generated test class
+    IMPORT_LINES = (
+        "import pytest",
+        "import unittest",
+        "from unittest.mock import Mock, patch",
+    )
+    
+    # Class body lines emitted before the generated test methods
+    CLASS_HEAD_LINES = ()
+    
+    # Class body and module lines emitted after the generated test methods
+    CLASS_TAIL_LINES = (
+        "    def setup_method(self):",
+        '        """Setup method called before each test"""',
+        "        pass",
+        "",
+        "    def teardown_method(self):",
+        '        """Teardown method called after each test"""',
+        "        pass",
+        "",
+        "if __name__ == '__main__':",
+        "    pytest.main([__file__])"
+    )
+    
+    # Upper bound on cached test methods before the cache is reset
+    METHOD_CACHE_SIZE = 4096
+    
+    def __init__(self):
+        # Generated method lines keyed by each requirement's id, text and
+        # category, so regenerating after an edit only builds changed methods
+        self._method_cache: Dict[Tuple[str, str, str], Tuple[str, ...]] = {}
+    
+    def generate_pytest_code(self, requirements: List[Dict[str, str]], class_name: str = "TestRequirements",
+                             parametrize: bool = False) -> str:
+        """Generate pytest code for the requirements, optionally as one parametrized test"""
+        code_lines = list(self.IMPORT_LINES)
+        code_lines.extend([
             "",
             f"class {class_name}:",
             '    """Test class for requirements validation"""',
             ""
-        ]
+        ])
+        code_lines.extend(self.CLASS_HEAD_LINES)
         
-        for req in requirements:
-            test_method = self._generate_test_method(req)
-            code_lines.extend(test_method)
+        if parametrize:
+            # A single test function with one case per requirement
+            code_lines.extend(self._generate_parametrized_method(requirements))
             code_lines.append("")
+        else:
+            method_cache = self._method_cache
+            if len(method_cache) > self.METHOD_CACHE_SIZE:
+                method_cache.clear()
+            
+            for req in requirements:
+                key = (req['id'], req['text'], req['category'])
+                test_method = method_cache.get(key)
+                if test_method is None:
+                    test_method = method_cache[key] = self._generate_test_method(req)
+                code_lines.extend(test_method)
+                code_lines.append("")
         
         # Add helper methods
-        code_lines.extend([
-            "    def setup_method(self):",
-            '        """Setup method called before each test"""',
-            "        pass",
-            "",
-            "    def teardown_method(self):",
-            '        """Teardown method called after each test"""',
-            "        pass",
-            "",
-            "if __name__ == '__main__':",
-            "    pytest.main([__file__])"
-        ])
+        code_lines.extend(self.CLASS_TAIL_LINES)
         
         return "\n".join(code_lines)
     
-    def _generate_test_method(self, requirement: Dict[str, str]) -> List[str]:
+    def _generate_test_method(self, requirement: Dict[str, str]) -> Tuple[str, ...]:
         """Generate a test method for a single requirement"""
-        method_name = self._create_method_name(requirement['text'])
+        text = requirement['text']
+        method_name = self._create_method_name(text)
         
-        lines = [
+        return (
             f"    def test_{method_name}(self):",
-            f'        """Test: {requirement["text"]}"""',
+            f'        """Test: {text}"""',
             f"        # TODO: Implement test for requirement {requirement['id']}",
             f"        # Category: {requirement['category']}",
-            f"        # Requirement: {requirement['text']}",
-            "        ",
-            "        # Example test structure:",
-            "        # 1. Setup test data",
-            "        # 2. Execute the functionality",
-            "        # 3. Assert expected results",
-            "        ",
-            "        assert True  # Replace with actual test implementation"
-        ]
-        
+            f"        # Requirement: {text}",
+        ) + _METHOD_STATIC_TAIL
+    
+    def _generate_parametrized_method(self, requirements: List[Dict[str, str]]) -> List[str]:
+        """Generate one test method parametrized over all requirements"""
+        lines = ['    @pytest.mark.parametrize("req_id,category,text", [']
+        # Cases are identified by requirement ID, e.g. test_requirement[REQ_001]
+        lines.extend(
+            f"        pytest.param({req['id']!r}, {req['category']!r}, {req['text']!r}, id={req['id']!r}),"
+            for req in requirements
+        )
+        lines.extend([
+            "    ])",
+            "    def test_requirement(self, req_id, category, text):",
+            '        """Test: one case per requirement"""',
+            "        # TODO: Implement test for each requirement",
+        ])
+        lines.extend(_METHOD_STATIC_TAIL)
         return lines
     
-    def _create_method_name(self, requirement_text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _create_method_name(requirement_text: str) -> str:
         """Create a valid Python method name from requirement text"""
         # Remove punctuation and convert to lowercase
-        name = re.sub(r'[^\w\s]', '', requirement_text.lower())
+        name = requirement_text.lower()
+        if name.isascii():
+            # Deleting bytes is a single C pass, cheaper than the regex engine
+            name = name.encode('ascii').translate(None, _PUNCT_BYTES).decode('ascii')
+        else:
+            name = _PUNCT.sub('', name)
         # Replace spaces with underscores
-        name = re.sub(r'\s+', '_', name)
+        name = _WS.sub('_', name)
         # Limit length
         name = name[:50]
         # Ensure it doesn't start with a number
         if name and name[0].isdigit():
             name = 'req_' + name
         
-        return name or 'requirement_test' 
\ No newline at end of file
+        return name or 'requirement_test' 
+
+
+class CategoryTestCodeGenerator(TestCodeGenerator):
+    """Generate pytest code with category-specific test bodies and helpers"""
+    
+    IMPORT_LINES = TestCodeGenerator.IMPORT_LINES + (
+        "import sys",
+        "import os",
+    )
+    
+    CLASS_HEAD_LINES = (
+        "    def setup_method(self):",
+        '        """Setup method called before each test"""',
+        "        # Initialize test data and mock objects",
+        "        self.mock_system = Mock()",
+        "        self.test_data = {'users': [], 'data': []}", 
+        "        pass",
+        "",
+    )
+    
+    CLASS_TAIL_LINES = (
+        "    def teardown_method(self):",
+        '        """Teardown method called after each test"""',
+        "        # Clean up after each test",
+        "        pass",
+        "",
+        "    def _validate_input(self, input_data):",
+        '        """Helper method for input validation tests"""',
+        "        if not input_data or not isinstance(input_data, (str, dict, list)):",
+        "            return False",
+        "        return True",
+        "",
+        "    def _authenticate_user(self, username, password):",
+        '        """Helper method for authentication tests"""',
+        "        # Mock authentication logic",
+        "        if username and password and len(password) >= 8:",
+        "            return True",
+        "        return False",
+        "",
+        "    def _save_data(self, data):",
+        '        """Helper method for save functionality tests"""',
+        "        # Mock save operation",
+        "        if data:",
+        "            self.test_data['data'].append(data)",
+        "            return True",
+        "        return False",
+        "",
+        "    def _display_message(self, message):",
+        '        """Helper method for display tests"""',
+        "        # Mock display operation",
+        "        if message and isinstance(message, str) and len(message) > 0:",
+        "            return message",
+        "        return None",
+        "",
+        "    def _check_performance(self, operation_time):",
+        '        """Helper method for performance tests"""',
+        "        # Mock performance check (operation should complete in < 1 second)",
+        "        return operation_time < 1.0",
+        "",
+        "if __name__ == '__main__':",
+        "    pytest.main([__file__])"
+    )
+    
+    # Test body lines for each lowercased category
+    CATEGORY_BODY_LINES = {
+        'validation': (
+            "        # Test input validation",
+            "        valid_input = 'valid test data'",
+            "        invalid_input = ''",
+            "        ",
+            "        assert self._validate_input(valid_input) == True",
+            "        assert self._validate_input(invalid_input) == False",
+            "        assert self._validate_input(None) == False",
+        ),
+        'security': (
+            "        # Test authentication/authorization",
+            "        valid_user = 'testuser'",
+            "        valid_password = 'password123'",
+            "        invalid_password = '123'",
+            "        ",
+            "        assert self._authenticate_user(valid_user, valid_password) == True",
+            "        assert self._authenticate_user(valid_user, invalid_password) == False",
+            "        assert self._authenticate_user('', valid_password) == False",
+        ),
+        'functional': (
+            "        # Test functional requirement",
+            "        test_data = {'id': 1, 'name': 'test'}",
+            "        empty_data = None",
+            "        ",
+            "        assert self._save_data(test_data) == True",
+            "        assert self._save_data(empty_data) == False",
+            "        assert len(self.test_data['data']) >= 1",
+        ),
+        'output': (
+            "        # Test output/display functionality",
+            "        test_message = 'Error: Invalid input'",
+            "        empty_message = ''",
+            "        ",
+            "        result = self._display_message(test_message)",
+            "        assert result is not None",
+            "        assert result == test_message",
+            "        assert self._display_message(empty_message) is None",
+        ),
+        'performance': (
+            "        # Test performance requirement",
+            "        import time",
+            "        ",
+            "        start_time = time.time()",
+            "        # Simulate fast operation",
+            "        time.sleep(0.1)  # 100ms - should pass",
+            "        operation_time = time.time() - start_time",
+            "        ",
+            "        assert self._check_performance(operation_time) == True",
+            "        # Test that slow operations fail",
+            "        assert self._check_performance(2.0) == False",
+        ),
+        'input': (
+            "        # Test input handling",
+            "        valid_inputs = ['test', {'key': 'value'}, [1, 2, 3]]",
+            "        invalid_inputs = [None, '', []]",
+            "        ",
+            "        for valid_input in valid_inputs:",
+            "            assert self._validate_input(valid_input) == True",
+            "        ",
+            "        for invalid_input in invalid_inputs:",
+            "            assert self._validate_input(invalid_input) == False",
+        ),
+    }
+    
+    # Test body lines for categories without a specific template
+    GENERIC_BODY_LINES = (
+        "        # Generic requirement test",
+        "        # TODO: Implement specific test logic for this requirement",
+        "        test_passed = True  # Replace with actual test logic",
+        "        assert test_passed == True",
+    )
+    
+    def _generate_test_method(self, requirement: Dict[str, str]) -> Tuple[str, ...]:
+        """Generate a test method for a single requirement"""
+        text = requirement['text']
+        category_name = requirement['category']
+        method_name = self._create_method_name(text)
+        
+        return (
+            f"    def test_{method_name}(self):",
+            f'        """Test: {text}"""',
+            f"        # Test for requirement {requirement['id']} - {category_name}",
+            "        # Generated test implementation",
+        ) + self.CATEGORY_BODY_LINES.get(category_name.lower(), self.GENERIC_BODY_LINES)
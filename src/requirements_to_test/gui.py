@@ -36,13 +36,11 @@ class RequirementsPanel(wx.Panel):
         title.SetFont(title_font)
         sizer.Add(title, 0, wx.ALL | wx.CENTER, 5)
         
-        # Scrolled panel for requirements
-        self.scroll_panel = wx.ScrolledWindow(self)
-        self.scroll_panel.SetScrollRate(5, 5)
-        self.requirements_sizer = wx.BoxSizer(wx.VERTICAL)
-        self.scroll_panel.SetSizer(self.requirements_sizer)
+        # Single list control for requirements, one checkable item each
+        self.check_list = wx.CheckListBox(self, choices=[])
+        self.check_list.Bind(wx.EVT_CHECKLISTBOX, self.on_requirement_check)
         
-        sizer.Add(self.scroll_panel, 1, wx.EXPAND | wx.ALL, 5)
+        sizer.Add(self.check_list, 1, wx.EXPAND | wx.ALL, 5)
         
         # Buttons
         button_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -67,47 +65,27 @@ class RequirementsPanel(wx.Panel):
         """Update the requirements display"""
         self.requirements = requirements
         
-        # Clear existing controls
-        self.requirements_sizer.Clear(True)
-        
-        # Add new requirement checkboxes
-        for req in requirements:
-            req_panel = wx.Panel(self.scroll_panel)
-            req_sizer = wx.BoxSizer(wx.HORIZONTAL)
-            
-            # Checkbox
-            checkbox = wx.CheckBox(req_panel, label="")
-            checkbox.SetValue(req['checked'])
-            checkbox.Bind(wx.EVT_CHECKBOX, lambda evt, r=req: self.on_requirement_check(evt, r))
-            
-            # Requirement text
-            text = wx.StaticText(req_panel, label=f"[{req['category']}] {req['text']}")
-            text.Wrap(400)
-            
-            req_sizer.Add(checkbox, 0, wx.ALL | wx.CENTER, 5)
-            req_sizer.Add(text, 1, wx.ALL | wx.EXPAND, 5)
-            
-            req_panel.SetSizer(req_sizer)
-            self.requirements_sizer.Add(req_panel, 0, wx.EXPAND | wx.ALL, 2)
-        
-        self.scroll_panel.FitInside()
-        self.Layout()
+        self.check_list.Set([f"[{req['category']}] {req['text']}" for req in requirements])
+        self.check_list.SetCheckedItems([i for i, req in enumerate(requirements) if req['checked']])
     
-    def on_requirement_check(self, event, requirement):
+    def on_requirement_check(self, event):
         """Handle requirement checkbox change"""
-        requirement['checked'] = event.IsChecked()
+        index = event.GetInt()
+        self.requirements[index]['checked'] = self.check_list.IsChecked(index)
     
     def on_check_all(self, event):
         """Check all requirements"""
-        for req in self.requirements:
-            req['checked'] = True
-        self.update_requirements(self.requirements)
+        self._set_all_checked(True)
     
     def on_uncheck_all(self, event):
         """Uncheck all requirements"""
-        for req in self.requirements:
-            req['checked'] = False
-        self.update_requirements(self.requirements)
+        self._set_all_checked(False)
+    
+    def _set_all_checked(self, checked: bool):
+        """Set every requirement and its list item without rebuilding the list"""
+        for index, req in enumerate(self.requirements):
+            req['checked'] = checked
+            self.check_list.Check(index, checked)
     
     def on_export_checklist(self, event):
         """Export requirements checklist to file"""
@@ -129,17 +107,27 @@ class RequirementsPanel(wx.Panel):
     def _export_to_file(self, filepath: str):
         """Export requirements to text file"""
         try:
-            with open(filepath, 'w') as f:
-                f.write("Requirements Checklist\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                for req in self.requirements:
-                    status = "☑" if req['checked'] else "☐"
-                    f.write(f"{status} [{req['category']}] {req['id']}: {req['text']}\n")
-                
-                f.write(f"\nTotal Requirements: {len(self.requirements)}\n")
-                f.write(f"Completed: {sum(1 for r in self.requirements if r['checked'])}\n")
+            # Assemble the whole checklist first so it is written in one call
+            parts = [
+                "Requirements Checklist\n",
+                "=" * 50 + "\n\n",
+                f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            ]
+            
+            completed = 0
+            for req in self.requirements:
+                if req['checked']:
+                    status = "☑"
+                    completed += 1
+                else:
+                    status = "☐"
+                parts.append(f"{status} [{req['category']}] {req['id']}: {req['text']}\n")
+            
+            parts.append(f"\nTotal Requirements: {len(self.requirements)}\n")
+            parts.append(f"Completed: {completed}\n")
+            
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write("".join(parts))
             
             wx.MessageBox(f"Checklist exported successfully to {filepath}", 
                          "Export Complete", wx.OK | wx.ICON_INFORMATION)
@@ -157,6 +145,12 @@ class MainFrame(wx.Frame):
         self.parser = RequirementsParser()
         self.test_generator = TestCodeGenerator()
         self.current_requirements = []
+        # Last generated test code and the requirements key it was built from
+        self._test_code_key = None
+        self._test_code = ''
+        # The test code control is read-only, so this mirrors its contents
+        # and spares copying the text back out of it
+        self._shown_test_code = ''
         
         self.setup_ui()
         self.setup_menu()
@@ -297,8 +291,8 @@ class MainFrame(wx.Frame):
         self.requirements_panel.update_requirements(self.current_requirements)
         
         # Generate test code
-        test_code = self.test_generator.generate_pytest_code(self.current_requirements)
-        self.test_code_text.SetValue(test_code)
+        test_code = self._generate_test_code(self.current_requirements)
+        self._show_test_code(test_code)
         
         # Switch to requirements tab
         self.notebook.SetSelection(0)
@@ -306,9 +300,24 @@ class MainFrame(wx.Frame):
         wx.MessageBox(f"Generated {len(self.current_requirements)} requirements!", 
                      "Generation Complete", wx.OK | wx.ICON_INFORMATION)
     
+    def _generate_test_code(self, requirements: List[Dict[str, str]]) -> str:
+        """Generate test code, reusing the last result for unchanged requirements"""
+        # Generated code only depends on each requirement's id, text and category
+        key = tuple((req['id'], req['text'], req['category']) for req in requirements)
+        if key != self._test_code_key:
+            self._test_code_key = key
+            self._test_code = self.test_generator.generate_pytest_code(requirements)
+        return self._test_code
+    
+    def _show_test_code(self, test_code: str):
+        """Display test code, leaving the control alone when it already shows it"""
+        if test_code != self._shown_test_code:
+            self._shown_test_code = test_code
+            self.test_code_text.SetValue(test_code)
+    
     def on_save_test_code(self, event):
         """Save generated test code to file"""
-        if not self.test_code_text.GetValue():
+        if not self._shown_test_code:
             wx.MessageBox("No test code to save!", "Save Error", wx.OK | wx.ICON_WARNING)
             return
         
@@ -320,8 +329,8 @@ class MainFrame(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             path = dlg.GetPath()
             try:
-                with open(path, 'w') as f:
-                    f.write(self.test_code_text.GetValue())
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(self._shown_test_code)
                 wx.MessageBox(f"Test code saved to {path}", "Save Complete", 
                              wx.OK | wx.ICON_INFORMATION)
             except Exception as e:
@@ -333,7 +342,7 @@ class MainFrame(wx.Frame):
     def on_copy_test_code(self, event):
         """Copy test code to clipboard"""
         if wx.TheClipboard.Open():
-            wx.TheClipboard.SetData(wx.TextDataObject(self.test_code_text.GetValue()))
+            wx.TheClipboard.SetData(wx.TextDataObject(self._shown_test_code))
             wx.TheClipboard.Close()
             wx.MessageBox("Test code copied to clipboard!", "Copy Complete", 
                          wx.OK | wx.ICON_INFORMATION)
@@ -341,7 +350,7 @@ class MainFrame(wx.Frame):
     def on_new(self, event):
         """Clear all content"""
         self.input_text.SetValue("")
-        self.test_code_text.SetValue("")
+        self._show_test_code("")
         self.current_requirements = []
         self.requirements_panel.update_requirements([])
     
@@ -394,6 +403,8 @@ class MainFrame(wx.Frame):
     
     def on_about(self, event):
         """Show about dialog"""
+        # Imported here so startup does not load the rarely used wx.adv
+        import wx.adv
         info = wx.adv.AboutDialogInfo()
         info.SetName("Requirements to Test Generator")
         info.SetVersion("1.0.0")
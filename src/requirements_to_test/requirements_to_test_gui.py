@@ -1,347 +1,32 @@
 import wx
-import re
 import os
 import sys
 import subprocess
 import tempfile
 import json
 import threading
-from typing import List, Dict, Tuple, Optional
+from collections import Counter
+from typing import List, Dict
 from datetime import datetime
 
 try:
+    from .parser import RequirementsParser
+    from .generator import CategoryTestCodeGenerator as TestCodeGenerator
     from .runner import TestRunner
 except Exception:
     # Allow running this module directly
+    from requirements_to_test.parser import RequirementsParser
+    from requirements_to_test.generator import CategoryTestCodeGenerator as TestCodeGenerator
     from requirements_to_test.runner import TestRunner
 
-class RequirementsParser:
-    """Parser to extract testable requirements from natural language text"""
-    
-    def __init__(self):
-        # Keywords that typically indicate requirements
-        self.requirement_keywords = [
-            'should', 'must', 'shall', 'will', 'needs to', 'required to',
-            'has to', 'ought to', 'is required', 'is expected', 'validates',
-            'ensures', 'verifies', 'checks', 'prevents', 'allows', 'enables'
-        ]
-    
-    def extract_requirements(self, text: str) -> List[Dict[str, str]]:
-        """Extract requirements from natural language text"""
-        requirements = []
-        sentences = re.split(r'[.!?]+', text)
-        
-        for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-                
-            # Check if sentence contains requirement keywords
-            if any(keyword in sentence.lower() for keyword in self.requirement_keywords):
-                # Clean up the sentence
-                clean_sentence = self._clean_requirement(sentence)
-                if clean_sentence:
-                    requirements.append({
-                        'id': f'REQ_{i+1:03d}',
-                        'text': clean_sentence,
-                        'category': self._categorize_requirement(clean_sentence),
-                        'checked': False,
-                        'sub_requirements': []  # New field for sub-goals
-                    })
-        
-        return requirements
-    
-    def add_sub_requirement(self, parent_req: Dict[str, str], sub_text: str) -> Dict[str, str]:
-        """Add a sub-requirement to a parent requirement"""
-        if 'sub_requirements' not in parent_req:
-            parent_req['sub_requirements'] = []
-        
-        sub_id = f"{parent_req['id']}.{len(parent_req['sub_requirements']) + 1}"
-        sub_req = {
-            'id': sub_id,
-            'text': self._clean_requirement(sub_text),
-            'category': self._categorize_requirement(sub_text),
-            'checked': False,
-            'parent_id': parent_req['id'],
-            'sub_requirements': []  # Allow nested sub-requirements
-        }
-        
-        parent_req['sub_requirements'].append(sub_req)
-        return sub_req
-    
-    def remove_sub_requirement(self, parent_req: Dict[str, str], sub_index: int) -> bool:
-        """Remove a sub-requirement by index"""
-        if 'sub_requirements' not in parent_req:
-            return False
-        
-        if 0 <= sub_index < len(parent_req['sub_requirements']):
-            parent_req['sub_requirements'].pop(sub_index)
-            # Renumber remaining sub-requirements and their nested sub-requirements
-            self._renumber_sub_requirements(parent_req)
-            return True
-        
-        return False
-    
-    def _renumber_sub_requirements(self, parent_req: Dict[str, str]):
-        """Renumber sub-requirements and recursively renumber their nested sub-requirements"""
-        if 'sub_requirements' not in parent_req:
-            return
-        
-        for i, sub_req in enumerate(parent_req['sub_requirements']):
-            old_id = sub_req['id']
-            new_id = f"{parent_req['id']}.{i + 1}"
-            sub_req['id'] = new_id
-            
-            # Update parent_id reference
-            sub_req['parent_id'] = parent_req['id']
-            
-            # Recursively renumber nested sub-requirements
-            if 'sub_requirements' in sub_req and sub_req['sub_requirements']:
-                self._renumber_sub_requirements(sub_req)
-    
-    def get_all_requirements_flat(self, requirements: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """Get a flat list of all requirements including nested sub-requirements"""
-        flat_list = []
-        
-        def flatten_recursive(req_list):
-            for req in req_list:
-                flat_list.append(req)
-                if 'sub_requirements' in req and req['sub_requirements']:
-                    flatten_recursive(req['sub_requirements'])
-        
-        flatten_recursive(requirements)
-        return flat_list
-    
-    def get_requirement_depth(self, req: Dict[str, str]) -> int:
-        """Get the depth level of a requirement based on its ID"""
-        return req['id'].count('.')
-    
-    def find_requirement_by_id(self, requirements: List[Dict[str, str]], req_id: str) -> Optional[Dict[str, str]]:
-        """Find a requirement by its ID, searching recursively through nested requirements"""
-        def search_recursive(req_list):
-            for req in req_list:
-                if req['id'] == req_id:
-                    return req
-                if 'sub_requirements' in req and req['sub_requirements']:
-                    found = search_recursive(req['sub_requirements'])
-                    if found:
-                        return found
-            return None
-        
-        return search_recursive(requirements)
-    
-    def _clean_requirement(self, sentence: str) -> str:
-        """Clean and format requirement sentence"""
-        # Remove extra whitespace
-        sentence = ' '.join(sentence.split())
-        
-        # Ensure sentence starts with capital letter
-        if sentence:
-            sentence = sentence[0].upper() + sentence[1:]
-        
-        # Ensure sentence ends with period
-        if sentence and not sentence.endswith('.'):
-            sentence += '.'
-        
-        return sentence
-    
-    def _categorize_requirement(self, sentence: str) -> str:
-        """Categorize requirement based on content"""
-        sentence_lower = sentence.lower()
-        
-        if any(word in sentence_lower for word in ['validate', 'check', 'verify', 'ensure']):
-            return 'Validation'
-        elif any(word in sentence_lower for word in ['input', 'enter', 'provide']):
-            return 'Input'
-        elif any(word in sentence_lower for word in ['output', 'display', 'show', 'return']):
-            return 'Output'
-        elif any(word in sentence_lower for word in ['security', 'authenticate', 'authorize']):
-            return 'Security'
-        elif any(word in sentence_lower for word in ['performance', 'speed', 'fast', 'time']):
-            return 'Performance'
-        else:
-            return 'Functional'
-
-class TestCodeGenerator:
-    """Generate pytest/unittest code from requirements"""
-    
-    def generate_pytest_code(self, requirements: List[Dict[str, str]], class_name: str = "TestRequirements") -> str:
-        """Generate pytest code for the requirements"""
-        code_lines = [
-            "import pytest",
-            "import unittest",
-            "from unittest.mock import Mock, patch",
-            "import sys",
-            "import os",
-            "",
-            f"class {class_name}:",
-            '    """Test class for requirements validation"""',
-            "",
-            "    def setup_method(self):",
-            '        """Setup method called before each test"""',
-            "        # Initialize test data and mock objects",
-            "        self.mock_system = Mock()",
-            "        self.test_data = {'users': [], 'data': []}", 
-            "        pass",
-            "",
-        ]
-        
-        for req in requirements:
-            test_method = self._generate_test_method(req)
-            code_lines.extend(test_method)
-            code_lines.append("")
-        
-        # Add helper methods
-        code_lines.extend([
-            "    def teardown_method(self):",
-            '        """Teardown method called after each test"""',
-            "        # Clean up after each test",
-            "        pass",
-            "",
-            "    def _validate_input(self, input_data):",
-            '        """Helper method for input validation tests"""',
-            "        if not input_data or not isinstance(input_data, (str, dict, list)):",
-            "            return False",
-            "        return True",
-            "",
-            "    def _authenticate_user(self, username, password):",
-            '        """Helper method for authentication tests"""',
-            "        # Mock authentication logic",
-            "        if username and password and len(password) >= 8:",
-            "            return True",
-            "        return False",
-            "",
-            "    def _save_data(self, data):",
-            '        """Helper method for save functionality tests"""',
-            "        # Mock save operation",
-            "        if data:",
-            "            self.test_data['data'].append(data)",
-            "            return True",
-            "        return False",
-            "",
-            "    def _display_message(self, message):",
-            '        """Helper method for display tests"""',
-            "        # Mock display operation",
-            "        if message and isinstance(message, str) and len(message) > 0:",
-            "            return message",
-            "        return None",
-            "",
-            "    def _check_performance(self, operation_time):",
-            '        """Helper method for performance tests"""',
-            "        # Mock performance check (operation should complete in < 1 second)",
-            "        return operation_time < 1.0",
-            "",
-            "if __name__ == '__main__':",
-            "    pytest.main([__file__])"
-        ])
-        
-        return "\n".join(code_lines)
-    
-    def _generate_test_method(self, requirement: Dict[str, str]) -> List[str]:
-        """Generate a test method for a single requirement"""
-        method_name = self._create_method_name(requirement['text'])
-        category = requirement['category'].lower()
-        
-        lines = [
-            f"    def test_{method_name}(self):",
-            f'        """Test: {requirement["text"]}"""',
-            f"        # Test for requirement {requirement['id']} - {requirement['category']}",
-            "        # Generated test implementation",
-        ]
-        
-        # Generate category-specific test implementation
-        if category == 'validation':
-            lines.extend([
-                "        # Test input validation",
-                "        valid_input = 'valid test data'",
-                "        invalid_input = ''",
-                "        ",
-                "        assert self._validate_input(valid_input) == True",
-                "        assert self._validate_input(invalid_input) == False",
-                "        assert self._validate_input(None) == False"
-            ])
-        elif category == 'security':
-            lines.extend([
-                "        # Test authentication/authorization",
-                "        valid_user = 'testuser'",
-                "        valid_password = 'password123'",
-                "        invalid_password = '123'",
-                "        ",
-                "        assert self._authenticate_user(valid_user, valid_password) == True",
-                "        assert self._authenticate_user(valid_user, invalid_password) == False",
-                "        assert self._authenticate_user('', valid_password) == False"
-            ])
-        elif category == 'functional':
-            lines.extend([
-                "        # Test functional requirement",
-                "        test_data = {'id': 1, 'name': 'test'}",
-                "        empty_data = None",
-                "        ",
-                "        assert self._save_data(test_data) == True",
-                "        assert self._save_data(empty_data) == False",
-                "        assert len(self.test_data['data']) >= 1"
-            ])
-        elif category == 'output':
-            lines.extend([
-                "        # Test output/display functionality",
-                "        test_message = 'Error: Invalid input'",
-                "        empty_message = ''",
-                "        ",
-                "        result = self._display_message(test_message)",
-                "        assert result is not None",
-                "        assert result == test_message",
-                "        assert self._display_message(empty_message) is None"
-            ])
-        elif category == 'performance':
-            lines.extend([
-                "        # Test performance requirement",
-                "        import time",
-                "        ",
-                "        start_time = time.time()",
-                "        # Simulate fast operation",
-                "        time.sleep(0.1)  # 100ms - should pass",
-                "        operation_time = time.time() - start_time",
-                "        ",
-                "        assert self._check_performance(operation_time) == True",
-                "        # Test that slow operations fail",
-                "        assert self._check_performance(2.0) == False"
-            ])
-        elif category == 'input':
-            lines.extend([
-                "        # Test input handling",
-                "        valid_inputs = ['test', {'key': 'value'}, [1, 2, 3]]",
-                "        invalid_inputs = [None, '', []]",
-                "        ",
-                "        for valid_input in valid_inputs:",
-                "            assert self._validate_input(valid_input) == True",
-                "        ",
-                "        for invalid_input in invalid_inputs:",
-                "            assert self._validate_input(invalid_input) == False"
-            ])
-        else:
-            # Generic test for unknown categories
-            lines.extend([
-                "        # Generic requirement test",
-                "        # TODO: Implement specific test logic for this requirement",
-                "        test_passed = True  # Replace with actual test logic",
-                "        assert test_passed == True"
-            ])
-        
-        return lines
-    
-    def _create_method_name(self, requirement_text: str) -> str:
-        """Create a valid Python method name from requirement text"""
-        # Remove punctuation and convert to lowercase
-        name = re.sub(r'[^\w\s]', '', requirement_text.lower())
-        # Replace spaces with underscores
-        name = re.sub(r'\s+', '_', name)
-        # Limit length
-        name = name[:50]
-        # Ensure it doesn't start with a number
-        if name and name[0].isdigit():
-            name = 'req_' + name
-        
-        return name or 'requirement_test'
+# Status indicator symbol, colour and tooltip prefix for each test outcome
+_STATUS_INDICATORS = {
+    'passed': ("✓", (0, 150, 0), "Test passed"),
+    'failed': ("✗", (200, 0, 0), "Test failed"),
+    'error': ("!", (255, 165, 0), "Test error"),
+    'skipped': ("~", (100, 100, 100), "Test skipped"),
+}
+_UNKNOWN_STATUS_INDICATOR = ("?", (100, 100, 100), "Unknown status")
 
 class RequirementsPanel(wx.Panel):
     """Panel for displaying and managing requirements checklist"""
@@ -350,6 +35,14 @@ class RequirementsPanel(wx.Panel):
         super().__init__(parent)
         self.requirements = []
         self.test_results = {}
+        # Displayed rows keyed by id() of their requirement dict; each row
+        # keeps the dict itself alive, so the key cannot be reused meanwhile
+        self._requirement_rows = {}
+        # The same rows keyed by requirement ID, for applying test results
+        self._rows_by_req_id = {}
+        # Rows keyed by the window IDs of their checkbox and buttons, so the
+        # scroll panel's handlers can find the requirement an event is for
+        self._rows_by_widget_id = {}
         self.setup_ui()
     
     def setup_ui(self):
@@ -374,6 +67,10 @@ class RequirementsPanel(wx.Panel):
         self.scroll_panel.SetScrollRate(5, 5)
         self.requirements_sizer = wx.BoxSizer(wx.VERTICAL)
         self.scroll_panel.SetSizer(self.requirements_sizer)
+        # Checkbox and button events of every requirement row propagate up to
+        # the scroll panel, so rows need no handlers of their own
+        self.scroll_panel.Bind(wx.EVT_CHECKBOX, self._on_row_checkbox)
+        self.scroll_panel.Bind(wx.EVT_BUTTON, self._on_row_button)
         
         sizer.Add(self.scroll_panel, 1, wx.EXPAND | wx.ALL, 5)
         
@@ -407,12 +104,25 @@ class RequirementsPanel(wx.Panel):
         self.requirements = requirements
         self.test_results = {}  # Clear test results when requirements change
         
-        # Clear existing controls
-        self.requirements_sizer.Clear(True)
-        
-        # Add requirements recursively
-        for req in requirements:
-            self._add_requirements_recursive(req, depth=0)
+        # Batch the rebuild into a single layout and repaint
+        self.scroll_panel.Freeze()
+        try:
+            # Detach the rows without destroying them, so panels of
+            # requirements still in the tree can be reused
+            self.requirements_sizer.Clear(False)
+            old_rows = self._requirement_rows
+            self._requirement_rows = {}
+            self._rows_by_req_id = {}
+            
+            # Add requirements and their nested sub-requirements
+            for req in requirements:
+                self._add_requirements_recursive(req, depth=0, old_rows=old_rows)
+            
+            # Destroy the panels of requirements that are gone
+            for row in old_rows.values():
+                self._destroy_requirement_panel(row)
+        finally:
+            self.scroll_panel.Thaw()
         
         self.scroll_panel.FitInside()
         self.Layout()
@@ -421,17 +131,31 @@ class RequirementsPanel(wx.Panel):
         self.run_tests_btn.Enable(len(requirements) > 0)
         self.update_status_text()
     
-    def _add_requirements_recursive(self, req: Dict[str, str], depth: int = 0, parent_req: Dict[str, str] = None):
-        """Recursively add requirement panels for nested sub-requirements"""
-        # Add the current requirement
-        self._add_requirement_panel(req, depth=depth, parent_req=parent_req)
-        
-        # Add its sub-requirements recursively
-        if 'sub_requirements' in req and req['sub_requirements']:
-            for sub_req in req['sub_requirements']:
-                self._add_requirements_recursive(sub_req, depth=depth + 1, parent_req=req)
+    def _add_requirements_recursive(self, req: Dict[str, str], depth: int = 0, parent_req: Dict[str, str] = None,
+                                    old_rows: Dict[int, Dict] = None):
+        """Add requirement panels for a requirement and its nested sub-requirements"""
+        # Walk the tree with an explicit stack; children are pushed in reverse
+        # so their panels are added in document order
+        stack = [(req, depth, parent_req)]
+        while stack:
+            req, depth, parent_req = stack.pop()
+            row = old_rows.pop(id(req), None) if old_rows else None
+            # A panel's indentation and delete button depend on its place in
+            # the tree, so it is only reused for the same place
+            if row is not None and row['depth'] == depth and row['parent_req'] is parent_req:
+                self._reuse_requirement_panel(row)
+            else:
+                if row is not None:
+                    self._destroy_requirement_panel(row)
+                row = self._add_requirement_panel(req, depth=depth, parent_req=parent_req)
+            self._requirement_rows[id(req)] = row
+            self._rows_by_req_id[req['id']] = row
+            
+            sub_reqs = req.get('sub_requirements')
+            if sub_reqs:
+                stack.extend((sub_req, depth + 1, req) for sub_req in reversed(sub_reqs))
     
-    def _add_requirement_panel(self, req: Dict[str, str], depth: int = 0, parent_req: Dict[str, str] = None):
+    def _add_requirement_panel(self, req: Dict[str, str], depth: int = 0, parent_req: Dict[str, str] = None) -> Dict:
         """Add a single requirement panel with proper indentation based on depth"""
         req_panel = wx.Panel(self.scroll_panel)
         req_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -451,7 +175,6 @@ class RequirementsPanel(wx.Panel):
         # Checkbox
         checkbox = wx.CheckBox(req_panel, label="")
         checkbox.SetValue(req['checked'])
-        checkbox.Bind(wx.EVT_CHECKBOX, lambda evt, r=req: self.on_requirement_check(evt, r))
         
         # Requirement text with proper tree symbols
         text_label = self._format_requirement_text(req, depth)
@@ -460,15 +183,15 @@ class RequirementsPanel(wx.Panel):
         
         # Buttons - every requirement can have sub-requirements
         add_sub_btn = wx.Button(req_panel, label="+ Sub", size=(50, 25))
-        add_sub_btn.Bind(wx.EVT_BUTTON, lambda evt, r=req: self.on_add_sub_requirement(evt, r))
         req['add_sub_btn'] = add_sub_btn
+        widgets = [checkbox, add_sub_btn]
         
         # Delete button for sub-requirements (not top-level)
         if depth > 0:
             del_sub_btn = wx.Button(req_panel, label="✗", size=(25, 25))
             del_sub_btn.SetForegroundColour(wx.Colour(200, 0, 0))
-            del_sub_btn.Bind(wx.EVT_BUTTON, lambda evt, sr=req, pr=parent_req: self.on_delete_sub_requirement(evt, sr, pr))
             req['del_sub_btn'] = del_sub_btn
+            widgets.append(del_sub_btn)
         
         # Layout the panel
         req_sizer.Add(status_label, 0, wx.ALL | wx.CENTER, 5)
@@ -481,6 +204,66 @@ class RequirementsPanel(wx.Panel):
         
         req_panel.SetSizer(req_sizer)
         self.requirements_sizer.Add(req_panel, 0, wx.EXPAND | wx.ALL, 2)
+        
+        row = {
+            'req': req,
+            'depth': depth,
+            'parent_req': parent_req,
+            'panel': req_panel,
+            'checkbox': checkbox,
+            'text': text,
+            'text_label': text_label,
+            'widget_ids': [widget.GetId() for widget in widgets]
+        }
+        for widget_id in row['widget_ids']:
+            self._rows_by_widget_id[widget_id] = row
+        return row
+    
+    def _destroy_requirement_panel(self, row: Dict):
+        """Destroy a requirement panel and forget its controls"""
+        # Window IDs are recycled once the controls are gone
+        for widget_id in row['widget_ids']:
+            self._rows_by_widget_id.pop(widget_id, None)
+        row['panel'].Destroy()
+    
+    def _on_row_checkbox(self, event):
+        """Dispatch a requirement checkbox event to its requirement"""
+        row = self._rows_by_widget_id.get(event.GetId())
+        if row is not None:
+            self.on_requirement_check(event, row['req'])
+    
+    def _on_row_button(self, event):
+        """Dispatch a '+ Sub' or delete button click to its requirement"""
+        row = self._rows_by_widget_id.get(event.GetId())
+        if row is None:
+            return
+        # widget_ids holds the checkbox, the '+ Sub' button and, for
+        # sub-requirements, the delete button, in that order
+        if event.GetId() == row['widget_ids'][1]:
+            self.on_add_sub_requirement(event, row['req'])
+        else:
+            self.on_delete_sub_requirement(event, row['req'], row['parent_req'])
+    
+    def _reuse_requirement_panel(self, row: Dict):
+        """Refresh an existing requirement panel and add it back to the list"""
+        req = row['req']
+        row['checkbox'].SetValue(req['checked'])
+        
+        # Ids shift when an earlier sibling is deleted
+        text_label = self._format_requirement_text(req, row['depth'])
+        if text_label != row['text_label']:
+            row['text_label'] = text_label
+            row['text'].SetLabel(text_label)
+            row['text'].Wrap(250 - (row['depth'] * 20))
+            row['panel'].Layout()
+        
+        # Test results are cleared whenever the requirements change
+        status_label = req['status_label']
+        status_label.SetLabel("○")
+        status_label.SetForegroundColour(wx.Colour(200, 200, 200))
+        status_label.SetToolTip("Test not run yet")
+        
+        self.requirements_sizer.Add(row['panel'], 0, wx.EXPAND | wx.ALL, 2)
     
     def _format_requirement_text(self, req: Dict[str, str], depth: int) -> str:
         """Format requirement text with appropriate tree symbols based on depth"""
@@ -508,6 +291,7 @@ class RequirementsPanel(wx.Panel):
                 if hasattr(main_frame, 'parser'):
                     # Add the sub-requirement
                     main_frame.parser.add_sub_requirement(parent_req, sub_text)
+                    main_frame._requirements_changed()
                     # Refresh the display
                     self.update_requirements(self.requirements)
                     # Regenerate test code
@@ -526,13 +310,12 @@ class RequirementsPanel(wx.Panel):
         )
         
         if dlg.ShowModal() == wx.ID_YES:
-            # Find the index of the sub-requirement
-            sub_index = -1
-            if 'sub_requirements' in parent_req:
-                for i, sr in enumerate(parent_req['sub_requirements']):
-                    if sr['id'] == sub_req['id']:
-                        sub_index = i
-                        break
+            # Sub-requirement ids end in their 1-based position among their
+            # siblings, so the index is read off the id instead of searched for
+            sub_reqs = parent_req.get('sub_requirements') or []
+            sub_index = int(sub_req['id'].rpartition('.')[2]) - 1
+            if not (0 <= sub_index < len(sub_reqs) and sub_reqs[sub_index]['id'] == sub_req['id']):
+                sub_index = -1
             
             if sub_index >= 0:
                 # Get the main frame to access the parser
@@ -540,6 +323,7 @@ class RequirementsPanel(wx.Panel):
                 if hasattr(main_frame, 'parser'):
                     # Remove the sub-requirement (this will also remove nested sub-requirements)
                     main_frame.parser.remove_sub_requirement(parent_req, sub_index)
+                    main_frame._requirements_changed()
                     # Refresh the display
                     self.update_requirements(self.requirements)
                     # Regenerate test code
@@ -552,21 +336,12 @@ class RequirementsPanel(wx.Panel):
         main_frame = self.GetTopLevelParent()
         if hasattr(main_frame, 'test_generator') and hasattr(main_frame, 'test_code_text'):
             # Get all requirements including sub-requirements
-            all_reqs = main_frame.parser.get_all_requirements_flat(self.requirements)
-            # Generate new test code
-            test_code = main_frame.test_generator.generate_pytest_code(all_reqs)
-            main_frame.test_code_text.SetValue(test_code)
+            all_reqs = main_frame._get_all_requirements()
+            # Generate new test code; the generator only rebuilds the methods
+            # of requirements that changed
+            test_code = main_frame._generate_test_code(all_reqs)
+            main_frame._show_test_code(test_code)
 
-    def update_test_results(self, test_results: Dict[str, Dict]):
-        """Update test results and visual indicators"""
-        self.test_results = test_results
-        
-        # Update all requirements recursively
-        self._update_requirements_recursive(self.requirements, test_results)
-        
-        self.update_status_text()
-        self.Layout()
-    
     def _update_requirement_status(self, req: Dict[str, str], test_results: Dict[str, Dict]):
         """Update status for a single requirement (main or sub)"""
         req_id = req['id']
@@ -574,28 +349,10 @@ class RequirementsPanel(wx.Panel):
         
         if status_label and req_id in test_results:
             result = test_results[req_id]
-            status = result['status']
-            
-            if status == 'passed':
-                status_label.SetLabel("✓")
-                status_label.SetForegroundColour(wx.Colour(0, 150, 0))
-                status_label.SetToolTip(f"Test passed - {result.get('message', '')}")
-            elif status == 'failed':
-                status_label.SetLabel("✗")
-                status_label.SetForegroundColour(wx.Colour(200, 0, 0))
-                status_label.SetToolTip(f"Test failed - {result.get('message', '')}")
-            elif status == 'error':
-                status_label.SetLabel("!")
-                status_label.SetForegroundColour(wx.Colour(255, 165, 0))
-                status_label.SetToolTip(f"Test error - {result.get('message', '')}")
-            elif status == 'skipped':
-                status_label.SetLabel("~")
-                status_label.SetForegroundColour(wx.Colour(100, 100, 100))
-                status_label.SetToolTip(f"Test skipped - {result.get('message', '')}")
-            else:
-                status_label.SetLabel("?")
-                status_label.SetForegroundColour(wx.Colour(100, 100, 100))
-                status_label.SetToolTip(f"Unknown status - {result.get('message', '')}")
+            symbol, colour, description = _STATUS_INDICATORS.get(result['status'], _UNKNOWN_STATUS_INDICATOR)
+            status_label.SetLabel(symbol)
+            status_label.SetForegroundColour(wx.Colour(*colour))
+            status_label.SetToolTip(f"{description} - {result.get('message', '')}")
 
     def update_status_text(self):
         """Update the status summary text"""
@@ -604,15 +361,17 @@ class RequirementsPanel(wx.Panel):
             self.status_text.SetForegroundColour(wx.Colour(100, 100, 100))
             return
         
-        passed = sum(1 for r in self.test_results.values() if r['status'] == 'passed')
-        failed = sum(1 for r in self.test_results.values() if r['status'] == 'failed')
-        error = sum(1 for r in self.test_results.values() if r['status'] == 'error')
-        skipped = sum(1 for r in self.test_results.values() if r['status'] == 'skipped')
+        counts = Counter(r['status'] for r in self.test_results.values())
+        passed = counts['passed']
+        failed = counts['failed']
+        error = counts['error']
+        skipped = counts['skipped']
         total = len(self.test_results)
         
-        # Count requirements at different levels
+        # Count requirements at different levels; every requirement in the
+        # tree has exactly one displayed row
         main_reqs = len(self.requirements)
-        total_reqs = self._count_all_requirements_recursive(self.requirements)
+        total_reqs = len(self._requirement_rows)
         sub_reqs = total_reqs - main_reqs
         
         status_text = f"Tests: {passed} passed, {failed} failed, {error} errors, {skipped} skipped"
@@ -627,63 +386,45 @@ class RequirementsPanel(wx.Panel):
         else:
             self.status_text.SetForegroundColour(wx.Colour(100, 100, 100))
     
-    def _count_all_requirements_recursive(self, requirements: List[Dict[str, str]]) -> int:
-        """Recursively count all requirements including nested sub-requirements"""
-        count = 0
-        for req in requirements:
-            count += 1  # Count this requirement
-            if 'sub_requirements' in req and req['sub_requirements']:
-                count += self._count_all_requirements_recursive(req['sub_requirements'])
-        return count
-    
     def clear_test_results(self):
         """Clear all test result indicators"""
         self.test_results = {}
         
-        # Clear all requirements recursively
-        self._clear_requirements_recursive(self.requirements)
+        # Every displayed requirement has a row, so no tree walk is needed
+        for row in self._requirement_rows.values():
+            status_label = row['req']['status_label']
+            status_label.SetLabel("○")
+            status_label.SetForegroundColour(wx.Colour(200, 200, 200))
+            status_label.SetToolTip("Test not run yet")
         
         self.update_status_text()
         self.Layout()
     
-    def _clear_requirements_recursive(self, requirements: List[Dict[str, str]]):
-        """Recursively clear test results for all requirements"""
-        for req in requirements:
-            status_label = req.get('status_label')
-            if status_label:
-                status_label.SetLabel("○")
-                status_label.SetForegroundColour(wx.Colour(200, 200, 200))
-                status_label.SetToolTip("Test not run yet")
-            
-            # Recursively clear sub-requirements
-            if 'sub_requirements' in req and req['sub_requirements']:
-                self._clear_requirements_recursive(req['sub_requirements'])
-    
     def update_test_results(self, test_results: Dict[str, Dict]):
         """Update test results and visual indicators"""
         self.test_results = test_results
         
-        # Update all requirements recursively
-        self._update_requirements_recursive(self.requirements, test_results)
+        # Only requirements with a result need updating; look their rows up
+        # by ID instead of walking the whole tree
+        rows_by_req_id = self._rows_by_req_id
+        for req_id in test_results:
+            row = rows_by_req_id.get(req_id)
+            if row is not None:
+                self._update_requirement_status(row['req'], test_results)
         
         self.update_status_text()
         self.Layout()
     
-    def _update_requirements_recursive(self, requirements: List[Dict[str, str]], test_results: Dict[str, Dict]):
-        """Recursively update test results for all requirements"""
-        for req in requirements:
-            self._update_requirement_status(req, test_results)
-            
-            # Recursively update sub-requirements
-            if 'sub_requirements' in req and req['sub_requirements']:
-                self._update_requirements_recursive(req['sub_requirements'], test_results)
-    
     def on_run_tests(self, event):
         """Handle run tests button click"""
-        # Clear previous test results and show running state
-        self.clear_test_results()
-        self.status_text.SetLabel("Tests are running...")
-        self.status_text.SetForegroundColour(wx.Colour(100, 100, 200))
+        # Clear previous test results and show running state in one repaint
+        self.Freeze()
+        try:
+            self.clear_test_results()
+            self.status_text.SetLabel("Tests are running...")
+            self.status_text.SetForegroundColour(wx.Colour(100, 100, 200))
+        finally:
+            self.Thaw()
         
         # Get the main frame to access test code and runner
         main_frame = self.GetTopLevelParent()
@@ -696,15 +437,23 @@ class RequirementsPanel(wx.Panel):
     
     def on_check_all(self, event):
         """Check all requirements"""
-        for req in self.requirements:
-            req['checked'] = True
-        self.update_requirements(self.requirements)
+        self._set_all_checked(True)
     
     def on_uncheck_all(self, event):
         """Uncheck all requirements"""
-        for req in self.requirements:
-            req['checked'] = False
-        self.update_requirements(self.requirements)
+        self._set_all_checked(False)
+    
+    def _set_all_checked(self, checked: bool):
+        """Set every main requirement and its checkbox without rebuilding the rows"""
+        self.scroll_panel.Freeze()
+        try:
+            for req in self.requirements:
+                req['checked'] = checked
+                row = self._requirement_rows.get(id(req))
+                if row is not None:
+                    row['checkbox'].SetValue(checked)
+        finally:
+            self.scroll_panel.Thaw()
     
     def on_export_checklist(self, event):
         """Export requirements checklist to file"""
@@ -726,17 +475,27 @@ class RequirementsPanel(wx.Panel):
     def _export_to_file(self, filepath: str):
         """Export requirements to text file"""
         try:
-            with open(filepath, 'w') as f:
-                f.write("Requirements Checklist\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                for req in self.requirements:
-                    status = "☑" if req['checked'] else "☐"
-                    f.write(f"{status} [{req['category']}] {req['id']}: {req['text']}\n")
-                
-                f.write(f"\nTotal Requirements: {len(self.requirements)}\n")
-                f.write(f"Completed: {sum(1 for r in self.requirements if r['checked'])}\n")
+            # Assemble the whole checklist first so it is written in one call
+            parts = [
+                "Requirements Checklist\n",
+                "=" * 50 + "\n\n",
+                f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            ]
+            
+            completed = 0
+            for req in self.requirements:
+                if req['checked']:
+                    status = "☑"
+                    completed += 1
+                else:
+                    status = "☐"
+                parts.append(f"{status} [{req['category']}] {req['id']}: {req['text']}\n")
+            
+            parts.append(f"\nTotal Requirements: {len(self.requirements)}\n")
+            parts.append(f"Completed: {completed}\n")
+            
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write("".join(parts))
             
             wx.MessageBox(f"Checklist exported successfully to {filepath}", 
                          "Export Complete", wx.OK | wx.ICON_INFORMATION)
@@ -754,6 +513,26 @@ class MainFrame(wx.Frame):
         self.test_generator = TestCodeGenerator()
         self.test_runner = TestRunner()
         self.current_requirements = []
+        # Last generated test code and the requirements key it was built from
+        self._test_code_key = None
+        self._test_code = ''
+        # The test code control is read-only, so this mirrors its contents
+        # and spares copying the text back out of it
+        self._shown_test_code = ''
+        # Flattened requirement tree, reused until the list is replaced or
+        # a sub-requirement is added or removed
+        self._flat_version = 0
+        self._flat_cache = (None, -1, [])
+        # Created on the first test run and hidden, not destroyed, afterwards
+        self.progress_dlg = None
+        # Whether the user cancelled the dialog during the last run
+        self._progress_cancelled = False
+        # Progress messages from the test thread are kept in a single slot
+        # and shown by a timer, at most ten times a second
+        self._pending_progress = None
+        self._progress_lock = threading.Lock()
+        self._progress_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_progress_timer, self._progress_timer)
         
         self.setup_ui()
         self.setup_menu()
@@ -890,23 +669,54 @@ class MainFrame(wx.Frame):
                          "No Requirements Found", wx.OK | wx.ICON_WARNING)
             return
         
-        # Update requirements panel
-        self.requirements_panel.update_requirements(self.current_requirements)
-        
-        # Generate test code for all requirements (including any existing sub-requirements)
-        all_reqs = self.parser.get_all_requirements_flat(self.current_requirements)
-        test_code = self.test_generator.generate_pytest_code(all_reqs)
-        self.test_code_text.SetValue(test_code)
-        
-        # Switch to requirements tab
-        self.notebook.SetSelection(0)
+        # Update requirements panel and switch to it, repainting it once
+        self.requirements_panel.Freeze()
+        try:
+            self.requirements_panel.update_requirements(self.current_requirements)
+            
+            # Generate test code for all requirements (including any existing sub-requirements)
+            all_reqs = self._get_all_requirements()
+            test_code = self._generate_test_code(all_reqs)
+            self._show_test_code(test_code)
+            
+            # Switch to requirements tab
+            self.notebook.SetSelection(0)
+        finally:
+            self.requirements_panel.Thaw()
         
         wx.MessageBox(f"Generated {len(self.current_requirements)} main requirements!", 
                      "Generation Complete", wx.OK | wx.ICON_INFORMATION)
     
+    def _get_all_requirements(self) -> List[Dict[str, str]]:
+        """Return the current requirements flattened, walking the tree only after it changed"""
+        source, version, flat = self._flat_cache
+        if source is not self.current_requirements or version != self._flat_version:
+            flat = self.parser.get_all_requirements_flat(self.current_requirements)
+            self._flat_cache = (self.current_requirements, self._flat_version, flat)
+        return flat
+    
+    def _requirements_changed(self):
+        """Invalidate the flattened requirements after the tree was edited"""
+        self._flat_version += 1
+    
+    def _generate_test_code(self, requirements: List[Dict[str, str]]) -> str:
+        """Generate test code, reusing the last result for unchanged requirements"""
+        # Generated code only depends on each requirement's id, text and category
+        key = tuple((req['id'], req['text'], req['category']) for req in requirements)
+        if key != self._test_code_key:
+            self._test_code_key = key
+            self._test_code = self.test_generator.generate_pytest_code(requirements)
+        return self._test_code
+    
+    def _show_test_code(self, test_code: str):
+        """Display test code, leaving the control alone when it already shows it"""
+        if test_code != self._shown_test_code:
+            self._shown_test_code = test_code
+            self.test_code_text.SetValue(test_code)
+    
     def on_save_test_code(self, event):
         """Save generated test code to file"""
-        if not self.test_code_text.GetValue():
+        if not self._shown_test_code:
             wx.MessageBox("No test code to save!", "Save Error", wx.OK | wx.ICON_WARNING)
             return
         
@@ -918,8 +728,8 @@ class MainFrame(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             path = dlg.GetPath()
             try:
-                with open(path, 'w') as f:
-                    f.write(self.test_code_text.GetValue())
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(self._shown_test_code)
                 wx.MessageBox(f"Test code saved to {path}", "Save Complete", 
                              wx.OK | wx.ICON_INFORMATION)
             except Exception as e:
@@ -931,7 +741,7 @@ class MainFrame(wx.Frame):
     def on_copy_test_code(self, event):
         """Copy test code to clipboard"""
         if wx.TheClipboard.Open():
-            wx.TheClipboard.SetData(wx.TextDataObject(self.test_code_text.GetValue()))
+            wx.TheClipboard.SetData(wx.TextDataObject(self._shown_test_code))
             wx.TheClipboard.Close()
             wx.MessageBox("Test code copied to clipboard!", "Copy Complete", 
                          wx.OK | wx.ICON_INFORMATION)
@@ -939,7 +749,7 @@ class MainFrame(wx.Frame):
     def on_new(self, event):
         """Clear all content"""
         self.input_text.SetValue("")
-        self.test_code_text.SetValue("")
+        self._show_test_code("")
         self.current_requirements = []
         self.requirements_panel.update_requirements([])
     
@@ -988,10 +798,15 @@ class MainFrame(wx.Frame):
     
     def on_exit(self, event):
         """Exit application"""
+        if self.progress_dlg:
+            self.progress_dlg.Destroy()
+            self.progress_dlg = None
         self.Close()
     
     def on_about(self, event):
         """Show about dialog"""
+        # Imported here so startup does not load the rarely used wx.adv
+        import wx.adv
         info = wx.adv.AboutDialogInfo()
         info.SetName("Requirements to Test Generator")
         info.SetVersion("1.0")
@@ -1009,30 +824,41 @@ class MainFrame(wx.Frame):
                          wx.OK | wx.ICON_WARNING)
             return
         
-        test_code = self.test_code_text.GetValue()
+        test_code = self._shown_test_code
         if not test_code:
             wx.MessageBox("No test code available to run!", "No Test Code", 
                          wx.OK | wx.ICON_WARNING)
             return
         
         # Get all requirements including sub-requirements for testing
-        all_reqs = self.parser.get_all_requirements_flat(self.current_requirements)
+        all_reqs = self._get_all_requirements()
         
         # Disable the run tests button during execution
         self.requirements_panel.run_tests_btn.Enable(False)
         self.requirements_panel.run_tests_btn.SetLabel("Running Tests...")
         
-        # Create a non-modal progress dialog
-        self.progress_dlg = wx.ProgressDialog(
-            "Running Tests",
-            "Preparing to run tests...",
-            maximum=100,
-            parent=self,
-            style=wx.PD_AUTO_HIDE | wx.PD_CAN_ABORT | wx.PD_ELAPSED_TIME
-        )
+        # Create a non-modal progress dialog, or show the one from the last run
+        if self.progress_dlg is None:
+            self.progress_dlg = wx.ProgressDialog(
+                "Running Tests",
+                "Preparing to run tests...",
+                maximum=100,
+                parent=self,
+                style=wx.PD_AUTO_HIDE | wx.PD_CAN_ABORT
+            )
+        else:
+            # Resume() is only valid after a cancel; a hidden dialog does not
+            # disable its parent again on its own, so do that here
+            if self._progress_cancelled:
+                self.progress_dlg.Resume()
+            self.progress_dlg.Update(0, "Preparing to run tests...")
+            self.Disable()
+            self.progress_dlg.Show()
+        self._progress_cancelled = False
         
         def progress_callback(message):
-            wx.CallAfter(self._update_progress, message)
+            with self._progress_lock:
+                self._pending_progress = message
         
         def run_tests_thread():
             try:
@@ -1050,24 +876,37 @@ class MainFrame(wx.Frame):
                 wx.CallAfter(self._handle_test_error, str(e))
         
         # Start test execution in background thread
+        self._progress_timer.Start(100)
         test_thread = threading.Thread(target=run_tests_thread)
         test_thread.daemon = True
         test_thread.start()
     
+    def _on_progress_timer(self, event):
+        """Show the latest progress message, if a new one arrived"""
+        with self._progress_lock:
+            message, self._pending_progress = self._pending_progress, None
+        if message is not None:
+            self._update_progress(message)
+    
     def _update_progress(self, message):
         """Update progress dialog (called from main thread)"""
-        if hasattr(self, 'progress_dlg') and self.progress_dlg:
+        if self.progress_dlg and self.progress_dlg.IsShown():
             keep_going, skip = self.progress_dlg.Update(50, message)
             if not keep_going:  # User clicked cancel
+                self._progress_cancelled = True
                 # Note: We can't actually cancel the test execution cleanly
                 # but we can hide the dialog
                 self._cleanup_progress_dialog()
     
     def _cleanup_progress_dialog(self):
         """Clean up the progress dialog"""
-        if hasattr(self, 'progress_dlg') and self.progress_dlg:
-            self.progress_dlg.Destroy()
-            self.progress_dlg = None
+        self._progress_timer.Stop()
+        with self._progress_lock:
+            self._pending_progress = None
+        if self.progress_dlg:
+            self.progress_dlg.Hide()
+        # Hiding does not re-enable the frame the way destroying the dialog did
+        self.Enable()
         
         # Re-enable the run tests button
         self.requirements_panel.run_tests_btn.Enable(True)
@@ -1075,41 +914,51 @@ class MainFrame(wx.Frame):
     
     def _update_test_results(self, results):
         """Update UI with test results (called from main thread)"""
+        # Clean up progress dialog first
+        self._cleanup_progress_dialog()
+        
         try:
-            # Clean up progress dialog first
-            self._cleanup_progress_dialog()
-            
-            # Update requirements panel with results
-            self.requirements_panel.update_test_results(results)
+            # Update requirements panel with results, repainting it once
+            self.requirements_panel.Freeze()
+            try:
+                self.requirements_panel.update_test_results(results)
+            finally:
+                self.requirements_panel.Thaw()
             
             # Show results summary dialog with OK button
-            passed = sum(1 for r in results.values() if r['status'] == 'passed')
-            failed = sum(1 for r in results.values() if r['status'] == 'failed')
-            errors = sum(1 for r in results.values() if r['status'] == 'error')
+            counts = Counter(r['status'] for r in results.values())
+            passed = counts['passed']
+            failed = counts['failed']
+            errors = counts['error']
             total = len(results)
             
             if failed > 0 or errors > 0:
                 icon = wx.ICON_WARNING
                 title = "Test Results - Some Issues Found"
+                lines = [
+                    "Test execution completed with issues!" if errors > 0 else "Test execution completed!",
+                    "",
+                    f"✓ Passed: {passed}",
+                    f"✗ Failed: {failed}",
+                ]
                 if errors > 0:
-                    summary = f"Test execution completed with issues!\n\n"
-                    summary += f"✓ Passed: {passed}\n"
-                    summary += f"✗ Failed: {failed}\n"
-                    summary += f"⚠ Errors: {errors}\n"
-                    summary += f"Total: {total}\n\n"
-                    summary += "Check the checklist for detailed results."
-                else:
-                    summary = f"Test execution completed!\n\n"
-                    summary += f"✓ Passed: {passed}\n"
-                    summary += f"✗ Failed: {failed}\n"
-                    summary += f"Total: {total}\n\n"
-                    summary += "Check the checklist for detailed results."
+                    lines.append(f"⚠ Errors: {errors}")
+                lines.extend([
+                    f"Total: {total}",
+                    "",
+                    "Check the checklist for detailed results."
+                ])
+                summary = "\n".join(lines)
             else:
                 icon = wx.ICON_INFORMATION
                 title = "Test Results - All Passed!"
-                summary = f"🎉 All tests passed successfully!\n\n"
-                summary += f"✓ Passed: {passed}/{total}\n\n"
-                summary += "Great job! All requirements are being met."
+                summary = "\n".join([
+                    "🎉 All tests passed successfully!",
+                    "",
+                    f"✓ Passed: {passed}/{total}",
+                    "",
+                    "Great job! All requirements are being met."
+                ])
             
             # Create a custom dialog with better formatting
             dlg = wx.MessageDialog(self, summary, title, wx.OK | icon)
@@ -1117,20 +966,19 @@ class MainFrame(wx.Frame):
             dlg.Destroy()
             
         except Exception as e:
-            self._cleanup_progress_dialog()
             wx.MessageBox(f"Error updating results: {str(e)}", "Update Error", 
                          wx.OK | wx.ICON_ERROR)
     
     def _handle_test_error(self, error_msg):
         """Handle test execution errors (called from main thread)"""
+        self._cleanup_progress_dialog()
+        
         try:
-            self._cleanup_progress_dialog()
             wx.MessageBox(f"Error running tests:\n\n{error_msg}\n\nPlease check that your test code is valid and try again.", 
                          "Test Execution Error", wx.OK | wx.ICON_ERROR)
         except Exception as e:
             # Fallback error handling
             print(f"Error in error handler: {e}")
-            self._cleanup_progress_dialog()
 
 class RequirementsApp(wx.App):
     """Main application class"""
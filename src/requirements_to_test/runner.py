@@ -2,12 +2,20 @@
 Lightweight pytest runner that does not depend on wxPython.
 """
 
-import re
 import os
 import sys
 import subprocess
 import tempfile
-from typing import List, Dict
+import threading
+from functools import lru_cache
+from typing import List, Dict, Optional
+from xml.etree import ElementTree
+
+try:
+    from .generator import TestCodeGenerator
+except Exception:
+    # Allow direct execution of this module
+    from requirements_to_test.generator import TestCodeGenerator
 
 
 class TestRunner:
@@ -16,9 +24,15 @@ class TestRunner:
     def __init__(self):
         self.test_results = {}
         self.python_executable = self._find_python_with_pytest()
+        # (id, text) pairs of the last requirements and their method mapping
+        self._method_to_req_cache = ((), {})
 
-    def _find_python_with_pytest(self) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _find_python_with_pytest() -> str:
         """Find a Python executable that has pytest installed"""
+        # Probing spawns an interpreter per candidate, so the answer is
+        # shared by every runner in the process
         candidates = [
             sys.executable,
             '/usr/local/opt/python@3.10/bin/python3.10',
@@ -43,28 +57,40 @@ class TestRunner:
     def run_tests(self, test_code: str, requirements: List[Dict[str, str]], progress_callback=None) -> Dict[str, Dict]:
         """Run pytest tests and return results mapped to requirement IDs"""
         results: Dict[str, Dict] = {}
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
-            temp_file.write(test_code)
-            temp_file_path = temp_file.name
+        temp_file_path = None
+        report_path = None
 
         try:
+            # The file is written once and only read back by pytest, so it
+            # gets one binary write with no text layer in between; the
+            # buffered writer retries short writes
+            fd, temp_file_path = tempfile.mkstemp(suffix='.py')
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(test_code.encode('utf-8'))
+            # Structured per-test outcomes, so results need not be scraped
+            # from the human-readable report
+            report_path = temp_file_path + '.xml'
+
             cmd = [
                 self.python_executable, '-m', 'pytest',
                 temp_file_path,
                 '-v',
-                '--tb=short'
+                '--tb=short',
+                f'--junitxml={report_path}'
             ]
 
             if progress_callback:
                 progress_callback("Starting test execution...")
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            returncode, output = self._run_pytest(cmd, len(requirements), progress_callback)
 
             if progress_callback:
                 progress_callback("Parsing test results...")
 
-            results = self._parse_pytest_output(result.stdout, result.stderr, result.returncode, requirements)
+            results = self._parse_junit_report(report_path, returncode, requirements)
+            if results is None:
+                # No report was written; fall back to the console output
+                results = self._parse_pytest_output(output, '', returncode, requirements)
 
             if progress_callback:
                 progress_callback("Test execution completed")
@@ -88,41 +114,122 @@ class TestRunner:
                     'duration': 0
                 }
         finally:
+            for path in (temp_file_path, report_path):
+                if path is None:
+                    continue
+                try:
+                    os.unlink(path)
+                except Exception:
+                    pass
+
+        return results
+
+    def _run_pytest(self, cmd: List[str], total: int, progress_callback=None, timeout: float = 60):
+        """Run pytest, reporting each finished test as its line arrives"""
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True, bufsize=1)
+        # Reading the pipe blocks, so the time limit is enforced by killing
+        # the process from a timer, which ends the read loop
+        timed_out = threading.Event()
+
+        def kill():
+            # A process that already exited finished in time, even if the
+            # read loop has not noticed yet
+            if process.poll() is None:
+                timed_out.set()
+                process.kill()
+
+        killer = threading.Timer(timeout, kill)
+        killer.start()
+        lines = []
+        finished = 0
+        counting = progress_callback is not None
+        try:
+            for line in process.stdout:
+                lines.append(line)
+                if not counting:
+                    continue
+                if 'short test summary info' in line:
+                    # The summary repeats failed and errored tests
+                    counting = False
+                elif '::test_' in line and ('PASSED' in line or 'FAILED' in line or 'ERROR' in line):
+                    finished += 1
+                    progress_callback(f"Tests finished: {finished}/{total}")
+            returncode = process.wait()
+        finally:
+            killer.cancel()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode, ''.join(lines)
+
+    def _parse_junit_report(self, report_path: str, returncode: int,
+                            requirements: List[Dict[str, str]]) -> Optional[Dict[str, Dict]]:
+        """Read test results from a JUnit XML report, or None if there is none"""
+        try:
+            root = ElementTree.parse(report_path).getroot()
+        except (OSError, ElementTree.ParseError):
+            return None
+
+        results = self._skipped_results(requirements)
+        parsed = False
+        method_to_req = self._method_to_req(requirements)
+        req_ids = results.keys()
+
+        for case in root.iter('testcase'):
+            req_id = self._req_id_for_test(case.get('name', ''), method_to_req, req_ids)
+            if not req_id:
+                continue
+
+            outcomes = {child.tag for child in case}
+            if 'error' in outcomes:
+                status = 'error'
+                message = 'Test error - check syntax'
+            elif 'failure' in outcomes:
+                status = 'failed'
+                message = 'Test failed - check implementation'
+            elif 'skipped' in outcomes:
+                # Reported like tests that never ran
+                continue
+            else:
+                status = 'passed'
+                message = 'Test passed successfully'
+
             try:
-                os.unlink(temp_file_path)
-            except Exception:
-                pass
+                duration = float(case.get('time') or 0)
+            except ValueError:
+                duration = 0
 
+            results[req_id] = {
+                'status': status,
+                'message': message,
+                'duration': duration
+            }
+            parsed = True
+
+        if not parsed:
+            self._infer_results(results, returncode)
         return results
 
     def _parse_pytest_output(self, stdout: str, stderr: str, returncode: int, requirements: List[Dict[str, str]]) -> Dict[str, Dict]:
         """Parse pytest output to extract test results"""
-        results: Dict[str, Dict] = {}
+        results = self._skipped_results(requirements)
+        parsed = False
 
-        method_to_req: Dict[str, str] = {}
-        for req in requirements:
-            method_name = f"test_{self._create_method_name(req['text'])}"
-            method_to_req[method_name] = req['id']
+        method_to_req = self._method_to_req(requirements)
+        req_ids = results.keys()
 
         output = stdout + stderr
-        lines = output.split('\n')
 
-        test_session_started = False
-        for line in lines:
-            line = line.strip()
-            if 'test session starts' in line.lower() or '=======' in line:
-                test_session_started = True
-                continue
-            if not test_session_started:
-                continue
-
-            if '::test_' in line and ('PASSED' in line or 'FAILED' in line or 'ERROR' in line):
+        for line in self._iter_result_lines(output):
+            if 'PASSED' in line or 'FAILED' in line or 'ERROR' in line:
                 parts = line.split('::')
                 if len(parts) >= 3:
                     test_method_part = parts[-1]
                     test_method = test_method_part.split()[0]
 
-                    req_id = method_to_req.get(test_method)
+                    req_id = self._req_id_for_test(test_method, method_to_req, req_ids)
                     if req_id:
                         if 'PASSED' in line:
                             status = 'passed'
@@ -150,39 +257,101 @@ class TestRunner:
                             'message': message,
                             'duration': duration
                         }
+                        parsed = True
 
-        if not results and returncode == 0:
-            for req in requirements:
-                results[req['id']] = {
-                    'status': 'passed',
-                    'message': 'Test passed (inferred from exit code)',
-                    'duration': 0
-                }
-        elif not results and returncode != 0:
-            for req in requirements:
-                results[req['id']] = {
-                    'status': 'failed',
-                    'message': 'Test failed (inferred from exit code)',
-                    'duration': 0
-                }
+        if not parsed:
+            self._infer_results(results, returncode)
+        return results
 
-        for req in requirements:
-            if req['id'] not in results:
-                results[req['id']] = {
-                    'status': 'skipped',
-                    'message': 'Test was not executed or could not be parsed',
-                    'duration': 0
-                }
+    def _method_to_req(self, requirements: List[Dict[str, str]]) -> Dict[str, str]:
+        """Map generated test method names to requirement IDs"""
+        # Re-runs usually test the same requirements, so the method names are
+        # only derived again when an id or text changed
+        key = tuple((req['id'], req['text']) for req in requirements)
+        cached_key, method_to_req = self._method_to_req_cache
+        if key != cached_key:
+            method_to_req = {f"test_{self._create_method_name(text)}": req_id
+                             for req_id, text in key}
+            self._method_to_req_cache = (key, method_to_req)
+        return method_to_req
 
-        return results
+    @staticmethod
+    def _req_id_for_test(test_method: str, method_to_req: Dict[str, str], req_ids) -> Optional[str]:
+        """Find the requirement ID a test method or parametrized case belongs to"""
+        req_id = method_to_req.get(test_method)
+        if req_id is None and test_method.endswith(']'):
+            # Parametrized cases are reported as test_name[REQ_ID]
+            case_id = test_method[test_method.find('[') + 1:-1]
+            if case_id in req_ids:
+                req_id = case_id
+        return req_id
+
+    @staticmethod
+    def _skipped_results(requirements: List[Dict[str, str]]) -> Dict[str, Dict]:
+        """Mark every requirement as skipped, for parsed outcomes to overwrite"""
+        return {
+            req['id']: {
+                'status': 'skipped',
+                'message': 'Test was not executed or could not be parsed',
+                'duration': 0
+            }
+            for req in requirements
+        }
+
+    @staticmethod
+    def _infer_results(results: Dict[str, Dict], returncode: int):
+        """Infer every requirement's result from the exit code when none was reported"""
+        if returncode == 0:
+            status = 'passed'
+            message = 'Test passed (inferred from exit code)'
+        else:
+            status = 'failed'
+            message = 'Test failed (inferred from exit code)'
+        for req_id in results:
+            results[req_id] = {
+                'status': status,
+                'message': message,
+                'duration': 0
+            }
+
+    def _iter_result_lines(self, output: str):
+        """Yield stripped lines of the output that mention a test method"""
+        # Results only count once the session header or a separator line has
+        # been seen, which pytest prints first, so this loop is short
+        pos = 0
+        while True:
+            end = output.find('\n', pos)
+            if self._is_session_line(output[pos:end] if end >= 0 else output[pos:]):
+                break
+            if end < 0:
+                return
+            pos = end + 1
+
+        # Jump between '::test_' occurrences with str.find instead of
+        # examining every traceback and log line in Python
+        while True:
+            found = output.find('::test_', pos)
+            if found < 0:
+                return
+            start = output.rfind('\n', 0, found) + 1
+            end = output.find('\n', found)
+            if end < 0:
+                end = len(output)
+            line = output[start:end].strip()
+            # Header and separator lines are never results
+            if not self._is_session_line(line):
+                yield line
+            pos = end
+
+    @staticmethod
+    def _is_session_line(line: str) -> bool:
+        """Whether a line is the session header or a separator"""
+        return 'test session starts' in line.lower() or '=======' in line
 
     def _create_method_name(self, requirement_text: str) -> str:
         """Create a valid Python method name from requirement text"""
-        name = re.sub(r'[^\w\s]', '', requirement_text.lower())
-        name = re.sub(r'\s+', '_', name)
-        name = name[:50]
-        if name and name[0].isdigit():
-            name = 'req_' + name
-        return name or 'requirement_test'
+        # Names must match the generated test methods, so the generator's
+        # translate-based and cached implementation is used as is
+        return TestCodeGenerator._create_method_name(requirement_text)
 
 
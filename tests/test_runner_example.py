@@ -5,6 +5,7 @@ Example script to test the TestRunner functionality
 
 import sys
 import os
+from collections import Counter
 
 # Enable local runs without installation: add src to path
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
@@ -14,6 +15,14 @@ if SRC_DIR not in sys.path:
 
 from requirements_to_test import TestRunner, RequirementsParser, TestCodeGenerator
 
+_STATUS_SYMBOL = {
+    'passed': '✓',
+    'failed': '✗',
+    'error': '!',
+    'skipped': '~',
+    'unknown': '?'
+}
+
 def test_runner_functionality():
     """Test the TestRunner with sample requirements"""
     
@@ -59,26 +68,43 @@ def test_runner_functionality():
         message = result['message']
         duration = result.get('duration', 0)
         
-        status_symbol = {
-            'passed': '✓',
-            'failed': '✗',
-            'error': '!',
-            'skipped': '~',
-            'unknown': '?'
-        }.get(status, '?')
+        status_symbol = _STATUS_SYMBOL.get(status, '?')
         
         print(f"{status_symbol} {req_id}: {status} ({duration:.3f}s)")
         if message:
             print(f"    {message}")
     
     # Summary
-    passed = sum(1 for r in results.values() if r['status'] == 'passed')
-    failed = sum(1 for r in results.values() if r['status'] == 'failed')
+    counts = Counter(r['status'] for r in results.values())
+    passed = counts['passed']
+    failed = counts['failed']
     total = len(results)
     
     print(f"\nSummary: {passed}/{total} tests passed, {failed} failed")
     
     return results
 
+def test_runner_parametrized_functionality():
+    """Test that parametrized cases are mapped back to their requirements"""
+    
+    sample_text = """
+    The application should validate user input.
+    The system must authenticate users before allowing access.
+    """
+    
+    parser = RequirementsParser()
+    requirements = parser.extract_requirements(sample_text)
+    
+    generator = TestCodeGenerator()
+    test_code = generator.generate_pytest_code(requirements, parametrize=True)
+    
+    runner = TestRunner()
+    results = runner.run_tests(test_code, requirements)
+    
+    for req in requirements:
+        print(f"{req['id']}: {results[req['id']]['status']}")
+        assert results[req['id']]['message'] == 'Test passed successfully'
+
 if __name__ == '__main__':
-    test_runner_functionality() 
\ No newline at end of file
+    test_runner_functionality()
+    test_runner_parametrized_functionality() 
\ No newline at end of file